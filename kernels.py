@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Numeric kernels for the Week3 Generative Poster app.
+# Kept in an importable module (rather than the Streamlit script) so numba's
+# on-disk cache can find the compiled kernel again across processes.
+
+import functools
+import math
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; blobs_batch falls back to plain NumPy
+    njit = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional too; used when numba is unavailable
+    ne = None
+else:
+    ne.set_num_threads(os.cpu_count() or 1)
+
+
+@functools.lru_cache(maxsize=8)
+def _unit_circle(points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Read-only (cos, sin) of ``points`` evenly spaced angles, shared by all layers."""
+    angles = np.linspace(0, 2 * math.pi, points, endpoint=False)
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    cos_a.flags.writeable = False
+    sin_a.flags.writeable = False
+    return cos_a, sin_a
+
+
+if njit is not None:
+
+    # Serial on purpose: Streamlit runs each session on its own thread, and
+    # numba's parallel threading layers are either not thread-safe
+    # (workqueue) or can hang interpreter shutdown (tbb). A few dozen
+    # layers is far too little work to amortise a thread fan-out anyway.
+    @njit(fastmath=True, cache=True)
+    def _blobs_kernel(centers, radii, wobble, wobble_rand, cos_a, sin_a, out_x, out_y):
+        """Fill (n, points) outline coordinates in place."""
+        n, points = wobble_rand.shape
+        for i in range(n):
+            for j in range(points):
+                r = radii[i] * (1.0 + wobble[i] * (wobble_rand[i, j] - 0.5))
+                out_x[i, j] = centers[i, 0] + r * cos_a[j]
+                out_y[i, j] = centers[i, 1] + r * sin_a[j]
+
+else:
+    _blobs_kernel = None
+
+
+def blobs_batch(centers, radii, points=200, wobble=0.15, rng: Optional[np.random.Generator] = None):
+    """Generate n wobbly blobs at once as (n, points) x / y arrays.
+
+    ``centers`` is (n, 2), ``radii`` is (n,); ``wobble`` is a scalar or one
+    value per blob. ``rng`` supplies the wobble noise (fresh if omitted).
+    """
+    centers = np.ascontiguousarray(centers, dtype=float)
+    radii = np.ascontiguousarray(radii, dtype=float)
+    wobble = np.ascontiguousarray(np.broadcast_to(np.asarray(wobble, dtype=float), radii.shape))
+    rng = np.random.default_rng() if rng is None else rng
+    wobble_rand = rng.random((len(radii), points))
+    cos_a, sin_a = _unit_circle(points)
+
+    if _blobs_kernel is not None:
+        x = np.empty_like(wobble_rand)
+        y = np.empty_like(wobble_rand)
+        _blobs_kernel(centers, radii, wobble, wobble_rand, cos_a, sin_a, x, y)
+        return x, y
+
+    if ne is not None:
+        # No JIT warmup; fused, chunked evaluation avoids the NumPy temporaries
+        radii_mat = ne.evaluate(
+            "r * (1 + w * (rand - 0.5))",
+            local_dict={"r": radii[:, None], "w": wobble[:, None], "rand": wobble_rand},
+        )
+        x = ne.evaluate("cx + rm * cos_a", local_dict={"cx": centers[:, 0:1], "rm": radii_mat, "cos_a": cos_a})
+        y = ne.evaluate("cy + rm * sin_a", local_dict={"cy": centers[:, 1:2], "rm": radii_mat, "sin_a": sin_a})
+        return x, y
+
+    radii_mat = radii[:, None] * (1 + wobble[:, None] * (wobble_rand - 0.5))
+    x = centers[:, 0:1] + radii_mat * cos_a
+    y = centers[:, 1:2] + radii_mat * sin_a
+    return x, y
@@ -4,70 +4,185 @@
 # Core logic and function names are preserved (random_palette, blob, generate_poster), with UI controls.
 #
 # How to run:
-#   1) pip install streamlit numpy matplotlib
+#   1) pip install -r requirements.txt   (numba, or else numexpr, is optional but speeds up blob generation)
 #   2) streamlit run week3_streamlit_app.py
 #
 # Notes:
 #   - You can control seed for reproducibility.
 #   - Supports multiple palettes (random / pastel / vivid / monochrome).
 #   - Includes style presets (Minimal / Vivid / NoiseTouch).
-#   - Allows saving PNG files directly from the app.
+#   - Allows saving PNG / PDF / SVG files directly from the app.
 
+import datetime
+import functools
+import gc
+import io
 import math
-import random
-from typing import List, Tuple, Optional
+import secrets
+from dataclasses import dataclass, replace
+from typing import Tuple, Optional
 
 import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # headless raster backend; must be set before pyplot is imported
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib import font_manager
+from PIL import Image, ImageDraw, ImageFont
 import streamlit as st
 
+from kernels import blobs_batch
+
 
 # -----------------------------
 # Original-like helper functions
 # -----------------------------
-def random_palette(k: int = 5) -> List[Tuple[float, float, float]]:
-    """Create and return k random RGB colors (0~1)."""
-    return [(random.random(), random.random(), random.random()) for _ in range(k)]
+def random_palette(k: int = 5, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Create and return k random RGB colors (0~1) as a (k, 3) array."""
+    rng = np.random.default_rng() if rng is None else rng
+    return rng.random((k, 3))
+
+
+# Fixed palette tables, built once as read-only (n, 3) arrays
+_PASTEL_COLORS = np.array([
+    (0.98, 0.74, 0.76),  # soft pink
+    (0.69, 0.88, 0.90),  # pastel blue
+    (0.77, 0.92, 0.80),  # mint green
+    (0.98, 0.91, 0.71),  # light yellow
+    (0.86, 0.77, 0.90),  # lavender
+    (0.99, 0.82, 0.64),  # peach
+])
+_VIVID_COLORS = np.array([
+    (1.0, 0.0, 0.0),   # bright red
+    (0.0, 0.7, 0.0),   # vivid green
+    (0.0, 0.0, 1.0),   # strong blue
+    (1.0, 0.5, 0.0),   # orange
+    (0.8, 0.0, 0.8),   # purple
+    (1.0, 1.0, 0.0),   # yellow
+])
+_PASTEL_COLORS.flags.writeable = False
+_VIVID_COLORS.flags.writeable = False
+
+
+def pastel_palette(k: int = 6, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Soft, pastel-like palette."""
+    colors = _PASTEL_COLORS
+    return colors[:k] if k <= len(colors) else np.vstack([colors, random_palette(k - len(colors), rng)])
 
 
-def pastel_palette(k: int = 6) -> List[Tuple[float, float, float]]:
-    """Soft, pastel-like palette."""
-    colors = [
-        (0.98, 0.74, 0.76),  # soft pink
-        (0.69, 0.88, 0.90),  # pastel blue
-        (0.77, 0.92, 0.80),  # mint green
-        (0.98, 0.91, 0.71),  # light yellow
-        (0.86, 0.77, 0.90),  # lavender
-        (0.99, 0.82, 0.64),  # peach
-    ]
-    return colors[:k] if k <= len(colors) else colors + random_palette(k - len(colors))
-
-
-def vivid_palette(k: int = 3) -> List[Tuple[float, float, float]]:
+def vivid_palette(k: int = 3, rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """High-contrast vivid palette."""
-    base = [
-        (1.0, 0.0, 0.0),   # bright red
-        (0.0, 0.7, 0.0),   # vivid green
-        (0.0, 0.0, 1.0),   # strong blue
-        (1.0, 0.5, 0.0),   # orange
-        (0.8, 0.0, 0.8),   # purple
-        (1.0, 1.0, 0.0),   # yellow
-    ]
-    return base[:k] if k <= len(base) else base + random_palette(k - len(base))
+    base = _VIVID_COLORS
+    return base[:k] if k <= len(base) else np.vstack([base, random_palette(k - len(base), rng)])
 
 
-def monochrome_palette(k: int = 3) -> List[Tuple[float, float, float]]:
-    """Monochrome blue shades."""
-    return [(0.2, 0.2 + i * 0.12, 0.6 + i * 0.05) for i in range(k)]
+def monochrome_palette(k: int = 3, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Monochrome blue shades (lightest channels saturate at 1.0 for large k; ``rng`` unused)."""
+    i = np.arange(k)
+    return np.clip(np.column_stack([np.full(k, 0.2), 0.2 + i * 0.12, 0.6 + i * 0.05]), 0.0, 1.0)
 
 
 def blob(center=(0.5, 0.5), r=0.3, points=200, wobble=0.15):
     """Generate a wobbly closed blob-like shape."""
-    angles = np.linspace(0, 2 * math.pi, points)
-    radii = r * (1 + wobble * (np.random.rand(points) - 0.5))
-    x = center[0] + radii * np.cos(angles)
-    y = center[1] + radii * np.sin(angles)
-    return x, y
+    x, y = blobs_batch(np.array([center]), np.array([r]), points=points, wobble=wobble)
+    return x[0], y[0]
+
+
+def _to_uint8(values) -> np.ndarray:
+    """Quantize 0~1 colour channels to uint8 (0~255)."""
+    return np.rint(np.clip(values, 0.0, 1.0) * 255).astype(np.uint8)
+
+
+def _text_color(bg_color) -> Tuple[float, float, float]:
+    """Black or white text, whichever contrasts with ``bg_color`` (Rec. 709 luminance)."""
+    r, g, b = bg_color
+    return (1.0, 1.0, 1.0) if 0.2126 * r + 0.7152 * g + 0.0722 * b < 0.5 else (0.0, 0.0, 0.0)
+
+
+PALETTE_MAP = {
+    "Random": random_palette,
+    "Pastel": pastel_palette,
+    "Vivid": vivid_palette,
+    "Monochrome": monochrome_palette,
+}
+
+
+# Largest size each palette can produce without drawing random colours
+_FIXED_PALETTE_SIZES = {
+    pastel_palette: len(_PASTEL_COLORS),
+    vivid_palette: len(_VIVID_COLORS),
+    monochrome_palette: math.inf,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _make_palette_cached(palette_fn, k: int, seed: Optional[int]) -> np.ndarray:
+    """Read-only (k, 3) uint8 palette, memoized on (palette function, size, seed).
+
+    Pass ``seed=None`` for palettes that don't use their rng, so every poster
+    shares one entry.
+    """
+    palette = _to_uint8(palette_fn(k, rng=np.random.default_rng(seed)))
+    palette.flags.writeable = False
+    return palette
+
+
+EXPORT_DPI = 300
+PREVIEW_POINTS = 150  # outline detail beyond this is invisible at on-screen preview size
+LARGE_RENDER_VERTICES = 10_000  # points * layers above which a render triggers gc.collect()
+PREVIEW_DPI = 100
+PREVIEW_SUPERSAMPLE = 2  # Pillow polygons are aliased; draw larger, then downscale
+
+# Text overlays, in axes coordinates / points (shared by export and preview)
+TITLE_XY, TITLE_SIZE = (0.05, 0.95), 18
+SUBTITLE_XY, SUBTITLE_SIZE = (0.05, 0.91), 11
+TITLE_STRIP_EXTENT = (0, 1, 0.88, 1)  # axes band holding both text lines in the preview
+
+
+def poster_layers(
+    palette_fn,
+    palette_size: int = 6,
+    n_layers: int = 8,
+    seed: Optional[int] = None,
+    wobble_min: float = 0.05,
+    wobble_max: float = 0.25,
+    radius_min: float = 0.02,
+    radius_max: float = 0.10,
+    points: int = 200,
+):
+    """Compute every blob layer: (n, points) x / y outlines and (n, 4) uint8 RGBA.
+
+    Shared by the matplotlib export and the Pillow preview so both draw the
+    same poster for a given seed.
+    """
+    # Seeded for reproducibility. Layout and outline wobble come from separate
+    # child streams, so the same seed gives the same layout at any ``points``.
+    rng, wobble_rng = (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(2))
+
+    # Palette, from an explicit seed drawn off the layout stream (always drawn,
+    # so the layout doesn't depend on the palette). Fixed palettes ignore it
+    # and share one cache entry across seeds.
+    palette_seed = int(rng.integers(1 << 31))
+    if palette_size <= _FIXED_PALETTE_SIZES.get(palette_fn, 0):
+        palette_seed = None
+    palette = _make_palette_cached(palette_fn, palette_size, palette_seed)
+
+    # Draw every layer's parameters in bulk
+    centers = rng.random((n_layers, 2))
+    radii = rng.uniform(radius_min, radius_max, n_layers)
+    wobbles = rng.uniform(wobble_min, wobble_max, n_layers)
+    color_idx = rng.integers(0, len(palette), n_layers)
+    alphas = rng.uniform(0.25, 0.6, n_layers)
+    xs, ys = blobs_batch(centers, radii, points=points, wobble=wobbles, rng=wobble_rng)
+
+    # Per-layer RGBA is kept as compact uint8; matplotlib only takes floats at the boundary
+    rgba = np.empty((n_layers, 4), dtype=np.uint8)
+    rgba[:, :3] = palette[color_idx]
+    rgba[:, 3] = _to_uint8(alphas)
+    return xs, ys, rgba
 
 
 def generate_poster(
@@ -83,42 +198,283 @@ def generate_poster(
     figsize=(7, 10),
     title_text: str = "Generative Poster",
     subtitle_text: str = "Week 2 • Arts & Advanced Big Data",
+    ax=None,
+    points: int = 200,
 ):
-    """Draw layered blobs using a chosen palette and parameters."""
-    # Seed for reproducibility
-    if seed is not None:
-        random.seed(seed)
-        np.random.seed(seed)
-
-    # Prepare canvas
-    fig, ax = plt.subplots(figsize=figsize)
+    """Draw layered blobs using a chosen palette and parameters.
+
+    Pass an existing ``ax`` to redraw into it (``figsize`` is then ignored);
+    otherwise a new pyplot figure is created, which the caller must close.
+    """
+    xs, ys, rgba = poster_layers(
+        palette_fn, palette_size, n_layers, seed, wobble_min, wobble_max, radius_min, radius_max, points
+    )
+
+    # Prepare canvas (the axes are hidden, so the figure carries the background)
+    if ax is None:
+        fig, ax = plt.subplots(figsize=figsize)
+    else:
+        fig = ax.figure
+        ax.clear()
     ax.axis("off")
     ax.set_facecolor(bg_color)
+    fig.set_facecolor(bg_color)
 
-    # Palette
-    palette = palette_fn(palette_size)
-
-    # Draw blobs
-    for _ in range(n_layers):
-        cx, cy = random.random(), random.random()
-        rr = random.uniform(radius_min, radius_max)
-        x, y = blob(center=(cx, cy), r=rr, wobble=random.uniform(wobble_min, wobble_max))
-        color = random.choice(palette)
-        alpha = random.uniform(0.25, 0.6)
-        ax.fill(x, y, color=color, alpha=alpha, edgecolor=(0, 0, 0, 0))
+    # Draw blobs as a single collection with per-polygon RGBA
+    blobs = PolyCollection(np.stack([xs, ys], axis=-1), facecolors=rgba / 255.0, edgecolors="none", antialiased=True)
+    ax.add_collection(blobs)
 
     # Text overlays
-    ax.text(0.05, 0.95, title_text, fontsize=18, weight="bold", transform=ax.transAxes)
-    ax.text(0.05, 0.91, subtitle_text, fontsize=11, transform=ax.transAxes)
+    text_color = _text_color(bg_color)
+    ax.text(*TITLE_XY, title_text, fontsize=TITLE_SIZE, weight="bold", color=text_color, transform=ax.transAxes)
+    ax.text(*SUBTITLE_XY, subtitle_text, fontsize=SUBTITLE_SIZE, color=text_color, transform=ax.transAxes)
 
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
     return fig
 
 
+@dataclass(frozen=True)
+class PosterParams:
+    """Every input that affects the rendered poster (hashable cache key)."""
+
+    palette_choice: str
+    palette_size: int
+    n_layers: int
+    points: int
+    seed: Optional[int]
+    wobble_min: float
+    wobble_max: float
+    radius_min: float
+    radius_max: float
+    bg_color: Tuple[float, float, float]
+    figsize: Tuple[float, float]
+    title_text: str
+    subtitle_text: str
+
+
+def _new_axes(figsize: Tuple[float, float]):
+    """Create a pyplot-free Agg (fig, ax) at export DPI.
+
+    Streamlit calls ``plt.close("all")`` after every script run, and pyplot's
+    figure registry is not thread-safe, so app figures bypass pyplot.
+    """
+    fig = Figure(figsize=figsize, dpi=EXPORT_DPI)
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def _draw_poster(params: PosterParams, ax):
+    """Draw ``params`` into ``ax`` with generate_poster and return the figure."""
+    return generate_poster(
+        palette_fn=PALETTE_MAP.get(params.palette_choice, random_palette),
+        palette_size=params.palette_size,
+        n_layers=params.n_layers,
+        seed=params.seed,
+        wobble_min=params.wobble_min,
+        wobble_max=params.wobble_max,
+        radius_min=params.radius_min,
+        radius_max=params.radius_max,
+        bg_color=params.bg_color,
+        figsize=params.figsize,
+        title_text=params.title_text,
+        subtitle_text=params.subtitle_text,
+        ax=ax,
+        points=params.points,
+    )
+
+
+def _png_from_canvas(fig) -> bytes:
+    """Encode the figure's Agg raster as PNG, cropped like ``bbox_inches="tight"``."""
+    canvas = fig.canvas
+    canvas.draw()
+    width, height = canvas.get_width_height()
+    img = Image.frombuffer("RGBA", (width, height), canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
+
+    # Tight bbox is in inches from the bottom-left; PIL crops from the top-left
+    bbox = fig.get_tightbbox(canvas.get_renderer()).padded(matplotlib.rcParams["savefig.pad_inches"])
+    box = (
+        max(0, math.floor(bbox.x0 * fig.dpi)),
+        max(0, math.floor(height - bbox.y1 * fig.dpi)),
+        min(width, math.ceil(bbox.x1 * fig.dpi)),
+        min(height, math.ceil(height - bbox.y0 * fig.dpi)),
+    )
+    buf = io.BytesIO()
+    img.crop(box).save(buf, format="PNG", optimize=False)
+    return buf.getvalue()
+
+
+def _release_render(fig, params: PosterParams):
+    """Drop a finished render's artists so idle figures hold no polygon data.
+
+    Figure <-> canvas <-> artist references form cycles, so large renders
+    also force a collection instead of waiting for the next GC generation.
+    """
+    for ax in fig.axes:
+        ax.clear()
+    if params.points * params.n_layers > LARGE_RENDER_VERTICES:
+        gc.collect()
+
+
+@functools.lru_cache(maxsize=16)
+def _overlay_font(size_px: int, bold: bool) -> ImageFont.FreeTypeFont:
+    """matplotlib's default font at ``size_px``, so Pillow text matches ``ax.text``."""
+    path = font_manager.findfont(font_manager.FontProperties(weight="bold" if bold else "normal"))
+    return ImageFont.truetype(path, size_px)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _title_strip(
+    title: str, subtitle: str, w_px: int, h_px: int, dpi: float, color: Tuple[float, float, float]
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """Title and subtitle pre-rendered as transparent RGBA uint8, plus its (left, top) offset.
+
+    Laid out on a (w_px, h_px) band spanning TITLE_STRIP_EXTENT of the axes,
+    then cropped to the inked area so compositing touches as few pixels as
+    possible. Depends only on the text, pixel size and colour, so slider
+    tweaks reuse it and skip FreeType entirely.
+    """
+    x0, x1, y0, y1 = TITLE_STRIP_EXTENT
+    rgb = tuple(_to_uint8(color).tolist())
+    img = Image.new("RGBA", (w_px, h_px), rgb + (0,))  # transparent, but text-coloured so edges don't fringe
+    draw = ImageDraw.Draw(img)
+    # Baseline-left anchored, like ax.text's defaults
+    for text, (tx, ty), size, bold in (
+        (title, TITLE_XY, TITLE_SIZE, True),
+        (subtitle, SUBTITLE_XY, SUBTITLE_SIZE, False),
+    ):
+        font = _overlay_font(round(size * dpi / 72), bold)
+        xy = ((tx - x0) / (x1 - x0) * w_px, (y1 - ty) / (y1 - y0) * h_px)
+        draw.text(xy, text, font=font, fill=rgb + (255,), anchor="ls")
+    bbox = img.getbbox()
+    if bbox is None:  # both strings empty
+        return np.zeros((0, 0, 4), dtype=np.uint8), (0, 0)
+    return np.asarray(img.crop(bbox)), bbox[:2]
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def render_preview(params: PosterParams) -> bytes:
+    """Rasterize the on-screen preview with Pillow (no matplotlib) and return PNG bytes.
+
+    Covers the same area as the export's axes, at PREVIEW_DPI. Outlines are
+    generated at full ``points`` and decimated to about PREVIEW_POINTS, so the
+    preview traces a subset of the export's vertices. Cached on every
+    parameter, so reruns with unchanged inputs are a dictionary lookup.
+    """
+    rc = matplotlib.rcParams
+    scale = PREVIEW_DPI * PREVIEW_SUPERSAMPLE
+    width = round(params.figsize[0] * (rc["figure.subplot.right"] - rc["figure.subplot.left"]) * scale)
+    height = round(params.figsize[1] * (rc["figure.subplot.top"] - rc["figure.subplot.bottom"]) * scale)
+
+    xs, ys, rgba = poster_layers(
+        PALETTE_MAP.get(params.palette_choice, random_palette),
+        params.palette_size,
+        params.n_layers,
+        params.seed,
+        params.wobble_min,
+        params.wobble_max,
+        params.radius_min,
+        params.radius_max,
+        params.points,
+    )
+    step = max(1, params.points // PREVIEW_POINTS)
+    xs, ys = xs[:, ::step], ys[:, ::step]
+    img = Image.new("RGB", (width, height), tuple(_to_uint8(params.bg_color).tolist()))
+    draw = ImageDraw.Draw(img, "RGBA")  # RGBA fills on an RGB image are alpha-blended
+    px, py = xs * width, (1.0 - ys) * height
+    for i in range(len(rgba)):
+        draw.polygon(list(zip(px[i].tolist(), py[i].tolist())), fill=tuple(rgba[i].tolist()))
+
+    # Text overlays: pasted from the cached strip, so slider tweaks skip FreeType
+    x0, x1, y0, y1 = TITLE_STRIP_EXTENT
+    strip, (left, top) = _title_strip(
+        params.title_text,
+        params.subtitle_text,
+        round(width * (x1 - x0)),
+        round(height * (y1 - y0)),
+        scale,
+        _text_color(params.bg_color),
+    )
+    if strip.size:
+        strip = Image.fromarray(strip)
+        img.paste(strip, (round(x0 * width) + left, round((1.0 - y1) * height) + top), strip)
+
+    img = img.resize((width // PREVIEW_SUPERSAMPLE, height // PREVIEW_SUPERSAMPLE), Image.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def render_poster_export(params: PosterParams, fmt: str) -> bytes:
+    """Render the full-detail poster as ``fmt`` ("png", "pdf" or "svg") bytes, on demand.
+
+    Called from download buttons, which run it on a separate thread, so it
+    always draws into its own pyplot-free figure.
+    """
+    fig = _draw_poster(params, _new_axes(params.figsize)[1])
+    try:
+        if fmt == "png":
+            return _png_from_canvas(fig)
+        buf = io.BytesIO()
+        fig.savefig(buf, dpi=EXPORT_DPI, bbox_inches="tight", format=fmt)
+        return buf.getvalue()
+    finally:
+        _release_render(fig, params)
+
+
+@st.cache_resource(show_spinner=False)
+def _warmup_kernels():
+    """Compile (or load from numba's disk cache) the blob kernel once per process."""
+    blobs_batch(np.full((1, 2), 0.5), np.full(1, 0.1), points=8, wobble=0.1)
+
+
+@st.fragment
+def render_poster(params: PosterParams):
+    """Poster canvas: generate on demand, otherwise show the last result.
+
+    Runs as a fragment, so the Generate / download buttons rerun only this
+    block. Sidebar changes rerun the page but just redisplay the cached preview.
+    """
+    just_generated = False
+    if st.button("Generate Poster", use_container_width=True):
+        # Resolve the seed up front so the cache key is deterministic
+        seed_to_use = params.seed if params.seed is not None else secrets.randbelow(2**32)
+        ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        resolved = replace(params, seed=seed_to_use)
+        st.session_state["poster"] = {
+            "requested": params,
+            "params": resolved,
+            "fname": f"poster_{ts}",
+        }
+        just_generated = True
+
+    poster = st.session_state.get("poster")
+    if poster is None:
+        st.info("Set your parameters on the left, then click **Generate Poster**.")
+        return
+
+    fname = poster["fname"]
+    st.image(render_preview(poster["params"]), use_container_width=True)  # render
+    if poster["requested"] != params:
+        st.caption("Parameters changed — click **Generate Poster** to redraw.")
+
+    # Offer downloads: rendered with matplotlib at full outline detail, and only when clicked
+    if just_generated:
+        st.success(f"Generated (seed {poster['params'].seed})")
+
+    def export(fmt):
+        return functools.partial(render_poster_export, poster["params"], fmt)
+
+    st.download_button("Download PNG (300 dpi)", data=export("png"), file_name=f"{fname}.png", mime="image/png", on_click="ignore", use_container_width=True)
+    st.download_button("Download PDF", data=export("pdf"), file_name=f"{fname}.pdf", mime="application/pdf", on_click="ignore", use_container_width=True)
+    st.download_button("Download SVG", data=export("svg"), file_name=f"{fname}.svg", mime="image/svg+xml", on_click="ignore", use_container_width=True)
+
+
 # -----------------------------
 # Streamlit UI
 # -----------------------------
+_warmup_kernels()  # keep JIT compilation off the first Generate click
 st.set_page_config(page_title="Week3 Generative Poster (Streamlit)", layout="wide")
 
 st.title("Week3 Generative Poster · Streamlit Edition")  # keep Week3 naming for continuity
@@ -145,6 +501,10 @@ with st.sidebar:
 
     n_layers = st.slider("Layers", 1, 50, 10)
 
+    points = st.slider(
+        "Outline Points", 50, 800, 200, step=10, help="Vertices per blob outline (full detail is used for downloads)"
+    )
+
     wobble_min, wobble_max = st.slider(
         "Wobble Range", 0.0, 2.0, (0.05, 0.25), step=0.01, help="Edge waviness of blobs"
     )
@@ -195,23 +555,15 @@ elif preset == "NoiseTouch":
     wobble_min, wobble_max = 0.60, 1.20
     palette_choice = "Random"
 
-# Choose palette function
-palette_map = {
-    "Random": random_palette,
-    "Pastel": pastel_palette,
-    "Vivid": vivid_palette,
-    "Monochrome": monochrome_palette,
-}
-palette_fn = palette_map.get(palette_choice, random_palette)
-
 # Draw button
 col_left, col_right = st.columns([2, 1])
 with col_left:
-    if st.button("Generate Poster", use_container_width=True):
-        fig = generate_poster(
-            palette_fn=palette_fn,
+    render_poster(
+        PosterParams(
+            palette_choice=palette_choice,
             palette_size=palette_size,
             n_layers=n_layers,
+            points=points,
             seed=seed_val,
             wobble_min=wobble_min,
             wobble_max=wobble_max,
@@ -222,19 +574,7 @@ with col_left:
             title_text=title_text,
             subtitle_text=subtitle_text,
         )
-        st.pyplot(fig)  # render
-
-        # Save PNG and offer download
-        import datetime, io
-        ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        fname = f"poster_{ts}.png"
-        buf = io.BytesIO()
-        fig.savefig(buf, dpi=300, bbox_inches="tight", format="png")
-        st.success(f"Saved: {fname}")
-        st.download_button("Download PNG (300 dpi)", data=buf.getvalue(), file_name=fname, mime="image/png", use_container_width=True)
-        plt.close(fig)
-    else:
-        st.info("Set your parameters on the left, then click **Generate Poster**.")
+    )
 
 with col_right:
     st.subheader("Quick Tips")